@@ -892,6 +892,18 @@ def _GenerateProgressStatusInfo(
             visible=not num_tasks_display_value is None,
         )
 
+        # The status colors are the same for every task
+        success_on, error_on, warning_on, color_off = (
+            (
+                TextwrapEx.SUCCESS_COLOR_ON,
+                TextwrapEx.ERROR_COLOR_ON,
+                TextwrapEx.WARNING_COLOR_ON,
+                TextwrapEx.COLOR_OFF,
+            )
+            if Capabilities.Get(sys.stdout).supports_colors
+            else ("", "", "", "")
+        )
+
         # ----------------------------------------------------------------------
         def OnTaskComplete(
             task_data: TaskData,
@@ -935,17 +947,6 @@ def _GenerateProgressStatusInfo(
 
             success_count, error_count, warning_count = on_task_complete_func(task_data)
 
-            if Capabilities.Get(sys.stdout).supports_colors:
-                success_on = TextwrapEx.SUCCESS_COLOR_ON
-                error_on = TextwrapEx.ERROR_COLOR_ON
-                warning_on = TextwrapEx.WARNING_COLOR_ON
-                color_off = TextwrapEx.COLOR_OFF
-            else:
-                success_on = ""
-                error_on = ""
-                warning_on = ""
-                color_off = ""
-
             parts: list[str] = []
 
             for color_on, count, suffix in [
@@ -13,14 +13,16 @@
 # ----------------------------------------------------------------------
 """Enhancements for the subprocess library."""
 
-import copy
+import asyncio
+import codecs
 import os
+import re
 import subprocess
 import textwrap
 
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Callable, cast, IO, Optional
+from typing import Callable, cast, Optional
 
 from dbrownell_Common.ContextlibEx import ExitStack
 from dbrownell_Common.Streams.Capabilities import Capabilities
@@ -52,19 +54,9 @@ class RunResult:
             assert self.error_command_line is not None
 
             raise Exception(
-                textwrap.dedent(
-                    """\
-                    Command Line
-                    ------------
-                    {}
-
-                    Output
-                    ------
-                    {}
-                    """,
-                ).format(
-                    self.error_command_line.rstrip(),
-                    self.output.rstrip(),
+                _RaiseOnErrorTemplate.format(
+                    command_line=self.error_command_line.rstrip(),
+                    output=self.output.rstrip(),
                 ),
             )
 
@@ -83,36 +75,47 @@ def Run(
 ) -> RunResult:
     """Runs a command line and returns the result."""
 
-    env_args: dict[str, str] = {
-        Capabilities.SIMULATE_TERMINAL_INTERACTIVE_ENV_VAR: "0",
-        Capabilities.SIMULATE_TERMINAL_HEADLESS_ENV_VAR: "1",
-    }
-
-    if supports_colors is not None:
-        env_args[Capabilities.SIMULATE_TERMINAL_COLORS_ENV_VAR] = "1" if supports_colors else "0"
-
     result = subprocess.run(
         command_line,
         check=False,
         cwd=cwd,
-        env=_SetEnvironment(env, **env_args),
+        env=_CreateRunEnvironment(env, supports_colors),
         shell=True,
         stderr=subprocess.STDOUT,
         stdout=subprocess.PIPE,
     )
 
-    content = result.stdout.decode("utf-8")
-    content = content.replace("\r\n", "\n")
+    return _CreateRunResult(command_line, result.returncode, result.stdout)
 
-    return RunResult(
-        result.returncode,
-        content,
-        command_line if result.returncode != 0 else None,
+
+# ----------------------------------------------------------------------
+async def RunAsync(
+    command_line: str,
+    cwd: Optional[Path] = None,
+    env: Optional[dict[str, str]] = None,
+    *,
+    supports_colors: Optional[bool] = None,
+) -> RunResult:
+    """Runs a command line and returns the result; multiple commands can be run concurrently via `asyncio.gather`."""
+
+    process = await asyncio.create_subprocess_shell(
+        command_line,
+        cwd=cwd,
+        env=_CreateRunEnvironment(env, supports_colors),
+        stderr=asyncio.subprocess.STDOUT,
+        stdout=asyncio.subprocess.PIPE,
     )
 
+    try:
+        output = (await process.communicate())[0]
+    finally:
+        await _EnsureProcessExitedAsync(process)
+
+    assert process.returncode is not None
+    return _CreateRunResult(command_line, process.returncode, output)
+
 
 # ----------------------------------------------------------------------
-# pylint: disable=too-many-locals
 def Stream(
     command_line: str,
     stream: TextWriterT,
@@ -125,92 +128,22 @@ def Stream(
     is_interactive: Optional[bool] = None,
     supports_colors: Optional[bool] = None,
 ) -> int:
-    output_func = cast(Callable[[str], None], stream.write)
-    flush_func = stream.flush
-
-    capabilities = Capabilities.Get(stream)
-
-    # Windows seems to want to interpret '\r\n' as '\n\n' when output is redirected to a file. Work
-    # around that issue as best as we can.
-    convert_newlines = False
-
-    if capabilities.is_interactive:
-        # Windows must always convert newlines
-        convert_newlines = os.name.lower() == "nt"
-
-    if convert_newlines:
-        newline_original_output_func = output_func
-
-        # ----------------------------------------------------------------------
-        def NewlineOutput(
-            content: str,
-        ) -> None:
-            newline_original_output_func(content.replace("\r\n", "\n"))
-
-        # ----------------------------------------------------------------------
-
-        output_func = NewlineOutput
-
-    if line_delimited_output:
-        line_delimited_original_output_func = output_func
-        line_delimited_original_flush_func = flush_func
-
-        cached_content: list[str] = []
-
-        # ----------------------------------------------------------------------
-        def LineDelimitedOutput(
-            content: str,
-        ) -> None:
-            if content.endswith("\n"):
-                content = "{}{}".format("".join(cached_content), content)
-                cached_content[:] = []
-
-                line_delimited_original_output_func(content)
-            else:
-                cached_content.append(content)
-
-        # ----------------------------------------------------------------------
-        def LineDelimitedFlush() -> None:
-            if cached_content:
-                content = "".join(cached_content)
-                cached_content[:] = []
-            else:
-                content = ""
-
-            if not content.endswith("\n"):
-                content += "\n"
-
-            line_delimited_original_output_func(content)
-            line_delimited_original_flush_func()
-
-        # ----------------------------------------------------------------------
-
-        output_func = LineDelimitedOutput
-        flush_func = LineDelimitedFlush
-
-    if is_headless is None:
-        is_headless = capabilities.is_headless
-    if is_interactive is None:
-        is_interactive = capabilities.is_interactive
-    if supports_colors is None:
-        supports_colors = capabilities.supports_colors
+    processor, flush_func, env = _CreateStreamInfo(
+        stream,
+        env,
+        line_delimited_output=line_delimited_output,
+        is_headless=is_headless,
+        is_interactive=is_interactive,
+        supports_colors=supports_colors,
+    )
 
     with subprocess.Popen(
         command_line,
         cwd=cwd,
-        env=_SetEnvironment(
-            env,
-            **{
-                "PYTHONUNBUFFERED": "1",
-                "COLUMNS": capabilities.columns,
-                Capabilities.SIMULATE_TERMINAL_HEADLESS_ENV_VAR: "1" if is_headless else "0",
-                Capabilities.SIMULATE_TERMINAL_INTERACTIVE_ENV_VAR: "1" if is_interactive else "0",
-                Capabilities.SIMULATE_TERMINAL_COLORS_ENV_VAR: "1" if supports_colors else "0",
-            },
-        ),
+        env=env,
         shell=True,
         stderr=subprocess.STDOUT,
-        stdin=subprocess.PIPE,
+        stdin=subprocess.PIPE if stdin is not None else subprocess.DEVNULL,
         stdout=subprocess.PIPE,
     ) as result:
         try:
@@ -224,11 +157,16 @@ def Stream(
 
                 assert result.stdout is not None
 
-                _ReadStateMachine.Execute(
-                    result.stdout,
-                    output_func,
-                    convert_newlines=convert_newlines,
-                )
+                read_func = getattr(result.stdout, "read1", result.stdout.read)
+
+                while True:
+                    stream_data = read_func(_ReadChunkSize)
+                    if not stream_data:
+                        break
+
+                    processor.Process(stream_data)
+
+                processor.Flush()
 
                 result_code = result.wait() or 0
 
@@ -238,63 +176,161 @@ def Stream(
         return result_code
 
 
+# ----------------------------------------------------------------------
+async def StreamAsync(
+    command_line: str,
+    stream: TextWriterT,
+    cwd: Optional[Path] = None,
+    env: Optional[dict[str, str]] = None,
+    *,
+    stdin: Optional[str] = None,
+    line_delimited_output: bool = False,  # Set to True to buffer lines
+    is_headless: Optional[bool] = None,
+    is_interactive: Optional[bool] = None,
+    supports_colors: Optional[bool] = None,
+) -> int:
+    """Streams the output of a command line; multiple commands can be run concurrently via `asyncio.gather`."""
+
+    processor, flush_func, env = _CreateStreamInfo(
+        stream,
+        env,
+        line_delimited_output=line_delimited_output,
+        is_headless=is_headless,
+        is_interactive=is_interactive,
+        supports_colors=supports_colors,
+    )
+
+    process = await asyncio.create_subprocess_shell(
+        command_line,
+        cwd=cwd,
+        env=env,
+        stderr=asyncio.subprocess.STDOUT,
+        stdin=asyncio.subprocess.PIPE if stdin is not None else asyncio.subprocess.DEVNULL,
+        stdout=asyncio.subprocess.PIPE,
+    )
+
+    try:
+        with ExitStack(flush_func):
+            if stdin is not None:
+                assert process.stdin is not None
+
+                try:
+                    process.stdin.write(stdin.encode("utf-8"))
+                    await process.stdin.drain()
+                    process.stdin.close()
+                except (BrokenPipeError, ConnectionResetError):
+                    return -1
+
+            assert process.stdout is not None
+
+            while True:
+                stream_data = await process.stdout.read(_ReadChunkSize)
+                if not stream_data:
+                    break
+
+                processor.Process(stream_data)
+
+            processor.Flush()
+
+            return await process.wait() or 0
+    finally:
+        await _EnsureProcessExitedAsync(process)
+
+
 # ----------------------------------------------------------------------
 # |
 # |  Private Types
 # |
 # ----------------------------------------------------------------------
-class _ReadStateMachine:
-    """Reads content produced by a stream, ensuring and ansi escape sequences are properly grouped."""
+class _DecodeProcessor:
+    """Writes content as soon as it is available, ensuring that multi-byte sequences are not split."""
 
     # ----------------------------------------------------------------------
-    @classmethod
-    def Execute(
-        cls,
-        input_stream: IO[bytes],
+    def __init__(
+        self,
         output_func: Callable[[str], None],
-        *,
-        convert_newlines: bool,
-    ) -> None:
-        machine = cls(
-            input_stream,
-            convert_newlines=convert_newlines,
-        )
-
-        while True:
-            if machine._buffered_input is not None:
-                input_data = machine._buffered_input
-                machine._buffered_input = None
-            else:
-                stream_data = machine._input_stream.read(1)
-                if not stream_data:
-                    break
+    ):
+        self._output_func = output_func
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
 
-                assert isinstance(stream_data, (str, bytes)), stream_data
-                input_data = ord(stream_data)
+    # ----------------------------------------------------------------------
+    def Process(
+        self,
+        data: bytes,
+    ) -> None:
+        content = self._decoder.decode(data)
+        if content:
+            self._output_func(content)
 
-            result = machine._process_func(input_data)
-            if result is None:
-                continue
+    # ----------------------------------------------------------------------
+    def Flush(self) -> None:
+        content = self._decoder.decode(b"", final=True)
+        if content:
+            self._output_func(content)
 
-            output_func(machine._ToString(result))
 
-        if machine._buffered_output:
-            output_func(machine._ToString(machine._buffered_output))
+# ----------------------------------------------------------------------
+class _ReadStateMachine:
+    """Processes content produced by a stream, ensuring and ansi escape sequences are properly grouped."""
 
     # ----------------------------------------------------------------------
     def __init__(
         self,
-        input_stream: IO[bytes],
+        output_func: Callable[[str], None],
         *,
         convert_newlines: bool,
     ):
-        self._input_stream = input_stream
+        self._output_func = output_func
         self._convert_newlines = convert_newlines
 
-        self._process_func: Callable[[int], Optional[list[int]]] = self._ProcessStandard
+        self._special_regex = (
+            self.__class__._SPECIAL_WITH_NEWLINES_REGEX  # pylint: disable=protected-access
+            if convert_newlines
+            else self.__class__._SPECIAL_REGEX  # pylint: disable=protected-access
+        )
+
+        self._process_func: Callable[[int], Optional[bytearray]] = self._ProcessStandard
 
-        self._buffered_input: Optional[int] = None
-        self._buffered_output: list[int] = []
+        self._reprocess_input = False
+        self._buffered_output = bytearray()
+
+    # ----------------------------------------------------------------------
+    def Process(
+        self,
+        data: bytes,
+    ) -> None:
+        view = memoryview(data)
+        len_view = len(view)
+        index = 0
+
+        while index < len_view:
+            if self._process_func == self._ProcessStandard:
+                # Write everything up to the next char that requires special processing as a
+                # single string rather than char-by-char.
+                match = self._special_regex.search(data, index)
+                end_index = match.start() if match else len_view
+
+                if end_index != index:
+                    self._output_func(str(view[index:end_index], "ascii"))
+
+                    index = end_index
+                    continue
+
+            result = self._process_func(view[index])
+            if result is not None:
+                self._output_func(self._ToString(result))
+
+            if self._reprocess_input:
+                self._reprocess_input = False
+            else:
+                index += 1
+
+    # ----------------------------------------------------------------------
+    def Flush(self) -> None:
+        if self._buffered_output:
+            self._output_func(self._ToString(self._FlushBufferedOutput()))
+
+        self._process_func = self._ProcessStandard
 
     # ----------------------------------------------------------------------
     # |
@@ -306,6 +342,9 @@ class _ReadStateMachine:
     _A = ord("A")
     _Z = ord("Z")
 
+    _SPECIAL_REGEX = re.compile(rb"[\x1b\x80-\xff]")
+    _SPECIAL_WITH_NEWLINES_REGEX = re.compile(rb"[\n\r\x1b\x80-\xff]")
+
     # ----------------------------------------------------------------------
     # |
     # |  Private Methods
@@ -338,26 +377,19 @@ class _ReadStateMachine:
     # ----------------------------------------------------------------------
     @staticmethod
     def _ToString(
-        value: list[int],
+        value: bytearray,
     ) -> str:
-        if len(value) == 1:
+        if len(value) == 1 and value[0] < 0x80:
             return chr(value[0])
 
-        result = bytearray(value)
-
-        # Attempt to decode as utf-8
-        try:
-            return result.decode("utf-8")
-        except (UnicodeDecodeError, LookupError):  # pragma: no cover
-            pass  # pragma: no cover
-
-        raise Exception("The content '{}' could not be decoded.".format(result))  # pragma: no cover
+        # Invalid utf-8 is replaced (rather than raising) to match the behavior of _DecodeProcessor
+        return value.decode("utf-8", errors="replace")
 
     # ----------------------------------------------------------------------
     def _ProcessStandard(
         self,
         value: int,
-    ) -> Optional[list[int]]:
+    ) -> Optional[bytearray]:
         assert not self._buffered_output
 
         if self.__class__._IsEscape(value):  # pylint: disable=protected-access
@@ -379,15 +411,13 @@ class _ReadStateMachine:
 
             return None
 
-        return [
-            value,
-        ]
+        return bytearray((value,))
 
     # ----------------------------------------------------------------------
     def _ProcessEscape(
         self,
         value: int,
-    ) -> Optional[list[int]]:
+    ) -> Optional[bytearray]:
         assert self._buffered_output
         self._buffered_output.append(value)
 
@@ -402,7 +432,7 @@ class _ReadStateMachine:
     def _ProcessLineReset(
         self,
         value: int,
-    ) -> Optional[list[int]]:
+    ) -> Optional[bytearray]:
         assert self._buffered_output
 
         if self._IsNewlineish(value):
@@ -411,8 +441,8 @@ class _ReadStateMachine:
 
         self._process_func = self._ProcessStandard
 
-        assert self._buffered_input is None
-        self._buffered_input = value
+        # Process this char again in the standard state
+        self._reprocess_input = True
 
         return self._FlushBufferedOutput()
 
@@ -420,7 +450,7 @@ class _ReadStateMachine:
     def _ProcessMultiByte(
         self,
         value: int,
-    ) -> Optional[list[int]]:
+    ) -> Optional[bytearray]:
         assert self._buffered_output
 
         if value >> 6 == 0b10:
@@ -430,37 +460,218 @@ class _ReadStateMachine:
 
         self._process_func = self._ProcessStandard
 
-        assert self._buffered_input is None
-        self._buffered_input = value
+        # Process this char again in the standard state
+        self._reprocess_input = True
 
         return self._FlushBufferedOutput()
 
     # ----------------------------------------------------------------------
-    def _FlushBufferedOutput(self) -> Optional[list[int]]:
+    def _FlushBufferedOutput(self) -> bytearray:
         assert self._buffered_output
 
         content = self._buffered_output
-        self._buffered_output = []
+        self._buffered_output = bytearray()
 
         return content
 
 
+# ----------------------------------------------------------------------
+# |
+# |  Private Data
+# |
+# ----------------------------------------------------------------------
+_ReadChunkSize = 65536
+
+_RaiseOnErrorTemplate = textwrap.dedent(
+    """\
+    Command Line
+    ------------
+    {command_line}
+
+    Output
+    ------
+    {output}
+    """,
+)
+
+
 # ----------------------------------------------------------------------
 # |
 # |  Private Functions
 # |
+# ----------------------------------------------------------------------
+def _CreateRunEnvironment(
+    env: Optional[dict[str, str]],
+    supports_colors: Optional[bool],
+) -> dict[str, str]:
+    env_args: dict[str, str] = {
+        Capabilities.SIMULATE_TERMINAL_INTERACTIVE_ENV_VAR: "0",
+        Capabilities.SIMULATE_TERMINAL_HEADLESS_ENV_VAR: "1",
+    }
+
+    if supports_colors is not None:
+        env_args[Capabilities.SIMULATE_TERMINAL_COLORS_ENV_VAR] = "1" if supports_colors else "0"
+
+    return _SetEnvironment(env, env_args)
+
+
+# ----------------------------------------------------------------------
+def _CreateRunResult(
+    command_line: str,
+    returncode: int,
+    output: bytes,
+) -> RunResult:
+    content = output.decode("utf-8")
+    content = content.replace("\r\n", "\n")
+
+    return RunResult(
+        returncode,
+        content,
+        command_line if returncode != 0 else None,
+    )
+
+
+# ----------------------------------------------------------------------
+# pylint: disable=too-many-locals
+def _CreateStreamInfo(
+    stream: TextWriterT,
+    env: Optional[dict[str, str]],
+    *,
+    line_delimited_output: bool,
+    is_headless: Optional[bool],
+    is_interactive: Optional[bool],
+    supports_colors: Optional[bool],
+) -> tuple[
+    _DecodeProcessor | _ReadStateMachine,
+    Callable[[], None],  # flush func
+    dict[str, str],  # env
+]:
+    output_func = cast(Callable[[str], None], stream.write)
+    flush_func = stream.flush
+
+    capabilities = Capabilities.Get(stream)
+
+    # Windows seems to want to interpret '\r\n' as '\n\n' when output is redirected to a file. Work
+    # around that issue as best as we can.
+    convert_newlines = False
+
+    if capabilities.is_interactive:
+        # Windows must always convert newlines
+        convert_newlines = os.name.lower() == "nt"
+
+    if convert_newlines:
+        newline_original_output_func = output_func
+
+        # ----------------------------------------------------------------------
+        def NewlineOutput(
+            content: str,
+        ) -> None:
+            newline_original_output_func(content.replace("\r\n", "\n"))
+
+        # ----------------------------------------------------------------------
+
+        output_func = NewlineOutput
+
+    if line_delimited_output:
+        line_delimited_original_output_func = output_func
+        line_delimited_original_flush_func = flush_func
+
+        cached_content: list[str] = []
+
+        # ----------------------------------------------------------------------
+        def LineDelimitedOutput(
+            content: str,
+        ) -> None:
+            index = content.rfind("\n") + 1
+            if index == 0:
+                cached_content.append(content)
+                return
+
+            line_content = "{}{}".format("".join(cached_content), content[:index])
+            cached_content[:] = []
+
+            if index != len(content):
+                cached_content.append(content[index:])
+
+            line_delimited_original_output_func(line_content)
+
+        # ----------------------------------------------------------------------
+        def LineDelimitedFlush() -> None:
+            if cached_content:
+                content = "".join(cached_content)
+                cached_content[:] = []
+            else:
+                content = ""
+
+            if not content.endswith("\n"):
+                content += "\n"
+
+            line_delimited_original_output_func(content)
+            line_delimited_original_flush_func()
+
+        # ----------------------------------------------------------------------
+
+        output_func = LineDelimitedOutput
+        flush_func = LineDelimitedFlush
+
+    processor: _DecodeProcessor | _ReadStateMachine
+
+    if not convert_newlines and not line_delimited_output:
+        # Nothing downstream depends on content being grouped, so forward content as it becomes
+        # available rather than processing it byte-by-byte.
+        processor = _DecodeProcessor(output_func)
+    else:
+        processor = _ReadStateMachine(output_func, convert_newlines=convert_newlines)
+
+    if is_headless is None:
+        is_headless = capabilities.is_headless
+    if is_interactive is None:
+        is_interactive = capabilities.is_interactive
+    if supports_colors is None:
+        supports_colors = capabilities.supports_colors
+
+    return (
+        processor,
+        flush_func,
+        _SetEnvironment(
+            env,
+            {
+                "PYTHONUNBUFFERED": "1",
+                "COLUMNS": str(capabilities.columns),
+                Capabilities.SIMULATE_TERMINAL_HEADLESS_ENV_VAR: "1" if is_headless else "0",
+                Capabilities.SIMULATE_TERMINAL_INTERACTIVE_ENV_VAR: "1" if is_interactive else "0",
+                Capabilities.SIMULATE_TERMINAL_COLORS_ENV_VAR: "1" if supports_colors else "0",
+            },
+        ),
+    )
+
+
+# ----------------------------------------------------------------------
+async def _EnsureProcessExitedAsync(
+    process: asyncio.subprocess.Process,
+) -> None:
+    # Kill the process if it is still running (for example, when the caller was cancelled or an
+    # exception was raised while processing its output) so that it is not left behind.
+    if process.returncode is not None:
+        return
+
+    try:
+        process.kill()
+    except ProcessLookupError:  # pragma: no cover
+        pass  # pragma: no cover
+
+    await process.wait()
+
+
 # ----------------------------------------------------------------------
 def _SetEnvironment(
     env: Optional[dict[str, str]],
-    **kwargs: Any,
+    overrides: dict[str, str],
 ) -> dict[str, str]:
     if env is None:
-        env = copy.deepcopy(os.environ)  # type: ignore
-
-    assert env is not None
+        env = os.environ.copy()
 
-    for k, v in kwargs.items():
-        env[k] = str(v) if not isinstance(v, str) else v
+    env.update(overrides)
 
     if "PYTHONIOENCODING" not in env:
         env["PYTHONIOENCODING"] = "utf-8"
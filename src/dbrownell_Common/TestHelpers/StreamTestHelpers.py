@@ -25,6 +25,17 @@ from dbrownell_Common.Streams.DoneManager import DoneManager, Flags as DoneManag
 
 
 # ----------------------------------------------------------------------
+_ScrubDurationRegex = re.compile(
+    r"""(?#
+    Hours                                   )(?P<hours>\d+)(?#
+    sep                                     )\:(?#
+    Minutes                                 )(?P<minutes>\d+)(?#
+    sep                                     )\:(?#
+    Seconds                                 )(?P<seconds>\d+(?:\.\d+)?)(?#
+    )""",
+)
+
+
 def ScrubDuration(
     content: str,
     *,
@@ -49,17 +60,7 @@ def ScrubDuration(
     else:
         replace_func = lambda _: "<scrubbed duration>"
 
-    return re.sub(
-        r"""(?#
-            Hours                           )(?P<hours>\d+)(?#
-            sep                             )\:(?#
-            Minutes                         )(?P<minutes>\d+)(?#
-            sep                             )\:(?#
-            Seconds                         )(?P<seconds>\d+(?:\.\d+)?)(?#
-            )""",
-        replace_func,
-        content,
-    )
+    return _ScrubDurationRegex.sub(replace_func, content)
 
 
 # ----------------------------------------------------------------------
@@ -13,9 +13,6 @@
 # ----------------------------------------------------------------------
 """Enhancements for the textwrap library."""
 
-import math
-import textwrap
-
 from enum import auto, Enum
 from typing import Callable, Optional
 
@@ -61,16 +58,15 @@ class Justify(Enum):
         value: str,
         padding: int,
     ) -> str:
-        if self == Justify.Left:
-            return value.ljust(padding)
-
-        if self == Justify.Center:
-            return value.center(padding)
+        return _JustifyFuncs[self](value, padding)
 
-        if self == Justify.Right:
-            return value.rjust(padding)
 
-        assert False, self  # pragma: no cover
+# ----------------------------------------------------------------------
+_JustifyFuncs: dict[Justify, Callable[[str, int], str]] = {
+    Justify.Left: str.ljust,
+    Justify.Center: str.center,
+    Justify.Right: str.rjust,
+}
 
 
 # ----------------------------------------------------------------------
@@ -87,18 +83,14 @@ def _CreateCustomPrefixFunc(
     ],
     str,
 ]:  # supports_colors
+    color_prefix = f"{color_value}{header}:{COLOR_OFF} "
+    no_color_prefix = f"{header}: "
+
     # ----------------------------------------------------------------------
     def Impl(
         supports_colors: bool,
     ) -> str:
-        if supports_colors:
-            this_color_on = color_value
-            this_color_off = COLOR_OFF
-        else:
-            this_color_on = ""
-            this_color_off = ""
-
-        return "{}{}:{} ".format(this_color_on, header, this_color_off)
+        return color_prefix if supports_colors else no_color_prefix
 
     # ----------------------------------------------------------------------
 
@@ -115,6 +107,15 @@ CreateDebugPrefix = _CreateCustomPrefixFunc("DEBUG", DEBUG_COLOR_ON)
 
 del _CreateCustomPrefixFunc
 
+# The indentation used when aligning multi-line content with the header (the length of the prefix
+# without color decorations)
+_ErrorPrefixWidth = len(CreateErrorPrefix(False))
+_WarningPrefixWidth = len(CreateWarningPrefix(False))
+_InfoPrefixWidth = len(CreateInfoPrefix(False))
+_SuccessPrefixWidth = len(CreateSuccessPrefix(False))
+_VerbosePrefixWidth = len(CreateVerbosePrefix(False))
+_DebugPrefixWidth = len(CreateDebugPrefix(False))
+
 
 # ----------------------------------------------------------------------
 def CreateErrorText(
@@ -125,6 +126,7 @@ def CreateErrorText(
 ) -> str:
     return _CreateText(
         CreateErrorPrefix,
+        _ErrorPrefixWidth,
         value,
         supports_colors=supports_colors,
         decorate_every_line=decorate_every_line,
@@ -140,6 +142,7 @@ def CreateWarningText(
 ) -> str:
     return _CreateText(
         CreateWarningPrefix,
+        _WarningPrefixWidth,
         value,
         supports_colors=supports_colors,
         decorate_every_line=decorate_every_line,
@@ -155,6 +158,7 @@ def CreateInfoText(
 ) -> str:
     return _CreateText(
         CreateInfoPrefix,
+        _InfoPrefixWidth,
         value,
         supports_colors=supports_colors,
         decorate_every_line=decorate_every_line,
@@ -170,6 +174,7 @@ def CreateSuccessText(
 ) -> str:
     return _CreateText(
         CreateSuccessPrefix,
+        _SuccessPrefixWidth,
         value,
         supports_colors=supports_colors,
         decorate_every_line=decorate_every_line,
@@ -185,6 +190,7 @@ def CreateVerboseText(
 ) -> str:
     return _CreateText(
         CreateVerbosePrefix,
+        _VerbosePrefixWidth,
         value,
         supports_colors=supports_colors,
         decorate_every_line=decorate_every_line,
@@ -200,6 +206,7 @@ def CreateDebugText(
 ) -> str:
     return _CreateText(
         CreateDebugPrefix,
+        _DebugPrefixWidth,
         value,
         supports_colors=supports_colors,
         decorate_every_line=decorate_every_line,
@@ -216,46 +223,7 @@ def CreateStatusText(
 ) -> str:
     """Returns text that contains information for the number of succeeded, failed, and warning items which is useful when displaying status information."""
 
-    if supports_colors:
-        success_on = SUCCESS_COLOR_ON
-        failed_on = ERROR_COLOR_ON
-        warning_on = WARNING_COLOR_ON
-        color_off = COLOR_OFF
-    else:
-        success_on = ""
-        failed_on = ""
-        warning_on = ""
-        color_off = ""
-
-    parts: list[str] = []
-
-    if succeeded is not None:
-        if succeeded == 0:
-            prefix = "0"
-        else:
-            prefix = "{}{}{}".format(success_on, succeeded, color_off)
-
-        parts.append("{} succeeded".format(prefix))
-
-    if failed is not None:
-        if failed == 0:
-            prefix = "0"
-        else:
-            prefix = "{}{}{}".format(failed_on, failed, color_off)
-
-        parts.append("{} failed".format(prefix))
-
-    if warnings is not None:
-        if warnings == 0:
-            prefix = "0"
-        else:
-            prefix = "{}{}{}".format(warning_on, warnings, color_off)
-
-        parts.append("{} warnings".format(prefix))
-
-    value = ", ".join(parts)
-
-    return value
+    return _StatusTextFuncs[supports_colors](succeeded, failed, warnings)
 
 
 # ----------------------------------------------------------------------
@@ -268,38 +236,28 @@ def Indent(
     """Ensures that each line in the provided value contains  the specified indentation."""
 
     if isinstance(indentation, int):
-        indentation = " " * indentation
+        indentation = _Spaces[indentation] if 0 <= indentation < len(_Spaces) else " " * indentation
     elif isinstance(indentation, str):
         # Nothing to do here
         pass
     else:
         assert False, indentation  # pragma: no cover
 
-    if skip_first_line:
-        is_first_line = True
-
-        # ----------------------------------------------------------------------
-        def ShouldIndent(_) -> bool:
-            nonlocal is_first_line
-
-            if is_first_line:
-                is_first_line = False
-                return False
-
-            return True
+    assert isinstance(indentation, str), indentation
 
-        # ----------------------------------------------------------------------
+    lines: list[str] = []
 
-        should_indent = ShouldIndent
-    else:
-        should_indent = lambda _: True
+    for line in value.splitlines(True):
+        if line.isspace():
+            lines.append(line)
+        elif skip_first_line:
+            # The first line is the first line that isn't whitespace
+            lines.append(line)
+            skip_first_line = False
+        else:
+            lines.append(indentation + line)
 
-    assert isinstance(indentation, str), indentation
-    return textwrap.indent(
-        value,
-        indentation,
-        lambda content: not content.isspace() and should_indent(content),
-    )
+    return "".join(lines)
 
 
 # ----------------------------------------------------------------------
@@ -314,19 +272,24 @@ def BoundedLJust(
 
     len_value = len(value)
 
+    if len_value == length:
+        return value
+
     if len_value < length:
         value = value.ljust(length)
-    elif len_value > length:
-        chars_to_trim = (len_value - length + 3) / 2
-        midpoint = math.floor(len_value / 2)
+    else:
+        chars_to_trim = len_value - length + 3
+        left_chars_to_trim = chars_to_trim // 2
+        right_chars_to_trim = chars_to_trim - left_chars_to_trim
+
+        midpoint = len_value // 2
 
         # Ensure a consistent ellipsis placement
         if not length & 1 and not len_value & 1:
             midpoint -= 1
 
-        value = "{}...{}".format(
-            value[: (midpoint - math.floor(chars_to_trim))],
-            value[(midpoint + math.ceil(chars_to_trim)) :],
+        value = (
+            f"{value[:midpoint - left_chars_to_trim]}...{value[midpoint + right_chars_to_trim:]}"
         )
 
     return value
@@ -337,7 +300,7 @@ def CreateAnsiHyperLink(
     url: str,
     value: str,
 ) -> str:
-    return "\033]8;;{}\033\\{}\033]8;;\033\\".format(url, value)
+    return f"\033]8;;{url}\033\\{value}\033]8;;\033\\"
 
 
 # ----------------------------------------------------------------------
@@ -357,42 +320,45 @@ def CreateTable(
     assert decorate_headers is False or decorate_values_func
 
     col_justifications = col_justifications or [Justify.Left] * len(headers)
-    decorate_values_func = decorate_values_func or (lambda _, row: row)
-    on_col_sizes_calculated = on_col_sizes_calculated or (lambda _: None)
 
     # Calculate the col sizes
+    num_cols = len(headers)
     col_sizes = [len(header) for header in headers]
 
     # Get the column size for each row
     for row in all_values:
-        assert len(row) == len(headers)
+        assert len(row) == num_cols
         for index, col_value in enumerate(row):
             col_sizes[index] = max(len(col_value), col_sizes[index])
 
-    on_col_sizes_calculated(col_sizes)
-
-    # Create the template
-    row_template = col_padding.join(
-        "{{:<{}}}".format(col_size) if col_size != 0 else "{}" for col_size in col_sizes
-    )
+    if on_col_sizes_calculated is not None:
+        on_col_sizes_calculated(col_sizes)
 
     # Create the rows
     rows: list[str] = []
 
+    justify_funcs = [_JustifyFuncs[col_justification] for col_justification in col_justifications]
+
     # ----------------------------------------------------------------------
     def CreateRow(
         index: int,
         values: list[str],
     ) -> None:
-        decorated_values: list[str] = []
+        decorated_values = [
+            col_value if len(col_value) == col_size else justify_func(col_value, col_size)
+            for justify_func, col_value, col_size in zip(justify_funcs, values, col_sizes)
+        ]
 
-        for col_justification, col_value, col_size in zip(col_justifications, values, col_sizes):
-            decorated_values.append(col_justification.Justify(col_value, col_size))
-
-        if index >= 0 or decorate_headers:
+        if decorate_values_func is not None and (index >= 0 or decorate_headers):
             decorated_values = decorate_values_func(index, decorated_values)
 
-        rows.append(row_template.format(*decorated_values).rstrip())
+            # Decorated values are no longer guaranteed to fill the column
+            decorated_values = [
+                col_value.ljust(col_size)
+                for col_value, col_size in zip(decorated_values, col_sizes)
+            ]
+
+        rows.append(col_padding.join(decorated_values).rstrip())
 
     # ----------------------------------------------------------------------
 
@@ -407,6 +373,52 @@ def CreateTable(
 
 # ----------------------------------------------------------------------
 # ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+def _CreateStatusTextFunc(
+    success_on: str,
+    failed_on: str,
+    warning_on: str,
+    color_off: str,
+) -> Callable[[Optional[int], Optional[int], Optional[int]], str]:
+    # ----------------------------------------------------------------------
+    def Impl(
+        succeeded: Optional[int],
+        failed: Optional[int],
+        warnings: Optional[int],
+    ) -> str:
+        parts: list[str] = []
+
+        if succeeded is not None:
+            parts.append(
+                f"{success_on}{succeeded}{color_off} succeeded" if succeeded else "0 succeeded"
+            )
+
+        if failed is not None:
+            parts.append(f"{failed_on}{failed}{color_off} failed" if failed else "0 failed")
+
+        if warnings is not None:
+            parts.append(
+                f"{warning_on}{warnings}{color_off} warnings" if warnings else "0 warnings"
+            )
+
+        return ", ".join(parts)
+
+    # ----------------------------------------------------------------------
+
+    return Impl
+
+
+# ----------------------------------------------------------------------
+# Indexed by `supports_colors`
+_StatusTextFuncs = (
+    _CreateStatusTextFunc("", "", "", ""),
+    _CreateStatusTextFunc(SUCCESS_COLOR_ON, ERROR_COLOR_ON, WARNING_COLOR_ON, COLOR_OFF),
+)
+
+# Indentation strings for common widths, shared across calls to `Indent`
+_Spaces: tuple[str, ...] = tuple(" " * index for index in range(33))
+
+
 # ----------------------------------------------------------------------
 def _CreateText(
     create_prefix_func: Callable[
@@ -415,6 +427,7 @@ def _CreateText(
         ],
         str,
     ],
+    indent_width: int,
     value: str,
     *,
     supports_colors: bool,
@@ -426,17 +439,15 @@ def _CreateText(
         return Indent(value, prefix)
 
     # Put newlines before the header
-    starting_index = 0
-
-    while starting_index < len(value) and value[starting_index] == "\n":
-        starting_index += 1
-
-    return "{}{}".format(
-        value[:starting_index],
-        Indent(
-            "{}{}".format(prefix, value[starting_index:]),
-            # The indent is the length of the prefix without color decorations
-            len(create_prefix_func(False)),
-            skip_first_line=True,
-        ),
+    stripped_value = value.lstrip("\n")
+
+    content = Indent(
+        prefix + stripped_value,
+        indent_width,
+        skip_first_line=True,
     )
+
+    if len(stripped_value) == len(value):
+        return content
+
+    return value[: len(value) - len(stripped_value)] + content
@@ -17,15 +17,14 @@ import re
 
 from dataclasses import dataclass
 from enum import auto, Enum
-from types import NoneType
+from functools import cache
+from types import NoneType, UnionType
 from typing import Any, Callable, ClassVar, Iterable, Optional, Type, TypeVar, Union
 
 import typer
 
 from typer import main as typer_main
 
-from dbrownell_Common import TextwrapEx
-
 
 # ----------------------------------------------------------------------
 # |
@@ -146,25 +145,14 @@ class PythonCodeGenerator:
             assert python_type is not None
             assert parameter_info is not None
 
-            python_type_name: Optional[str] = None
-
             if isinstance(python_type, str):
-                if python_type.startswith("typing."):
-                    python_type_name = python_type[len("typing.") :]
-                else:
-                    python_type_name = python_type
+                python_type_name = python_type.removeprefix("typing.")
             else:
                 python_type_name = python_type.__name__
 
-            assert python_type_name is not None
-
             types[k] = parameter_info
 
-            parameters[k] = '{name}: {python_type_name}={var_name}["{name}"]'.format(
-                name=k,
-                python_type_name=python_type_name,
-                var_name=option_type_values_var_name,
-            )
+            parameters[k] = f'{k}: {python_type_name}={option_type_values_var_name}["{k}"]'
 
         return PythonCodeGenerator(parameters, types)
 
@@ -177,10 +165,10 @@ class PythonCodeGenerator:
         skip_first_line: bool = True,
     ) -> str:
         if single_line:
-            return ", ".join(parameter for parameter in self.python_parameters.values())
+            return ", ".join(self.python_parameters.values())
 
-        return TextwrapEx.Indent(
-            "\n".join("{},".format(parameter) for parameter in self.python_parameters.values()),
+        return _CreateMultilineList(
+            self.python_parameters.values(),
             indentation,
             skip_first_line=skip_first_line,
         )
@@ -194,25 +182,22 @@ class PythonCodeGenerator:
         indentation: int = 4,
         skip_first_line: bool = True,
     ) -> str:
+        arguments: Iterable[str]
+
         if argument_type == PythonCodeGenerator.ArgumentTypes.CommaDelimited:
-            decorate_parameter_func = lambda value: value
+            arguments = self.python_parameters.keys()
         elif argument_type == PythonCodeGenerator.ArgumentTypes.DictArgs:
-            decorate_parameter_func = lambda value: '"{value}": {value}'.format(value=value)
+            arguments = [f'"{parameter}": {parameter}' for parameter in self.python_parameters]
         elif argument_type == PythonCodeGenerator.ArgumentTypes.KeywordArgs:
-            decorate_parameter_func = lambda value: "{value}={value}".format(value=value)
+            arguments = [f"{parameter}={parameter}" for parameter in self.python_parameters]
         else:
             assert False, argument_type  # pragma: no cover
 
         if single_line:
-            return ", ".join(
-                decorate_parameter_func(parameter) for parameter in self.python_parameters.keys()
-            )
-
-        return TextwrapEx.Indent(
-            "\n".join(
-                "{},".format(decorate_parameter_func(parameter))
-                for parameter in self.python_parameters.keys()
-            ),
+            return ", ".join(arguments)
+
+        return _CreateMultilineList(
+            arguments,
             indentation,
             skip_first_line=skip_first_line,
         )
@@ -400,6 +385,15 @@ def ProcessDynamicArgs(
             extra_args = ProcessDynamicArgs(ctx, type_definitions)
     """
 
+    click_params = _TypeDefinitionItemsToClickParams(
+        ResolveTypeDefinitions(
+            type_definitions,
+            force_optional=True,
+        ),
+    )
+
+    argument_to_result_names = _CreateArgumentToResultNames(click_params)
+
     # Group the arguments
     arguments: list[tuple[str, Optional[str]]] = []
 
@@ -415,18 +409,17 @@ def ProcessDynamicArgs(
 
             arguments[-1] = (arguments[-1][0], arg)
 
-    # Read default_map, which may be populated by typer-config
-    for k, v in (ctx.default_map or {}).items():
-        arguments.append((k, v))
+    # Read default_map, which may be populated by typer-config. The map contains values for all of
+    # the command's parameters, so only consider those that correspond to dynamic arguments.
+    if ctx.default_map:
+        for k, v in ctx.default_map.items():
+            if k in argument_to_result_names:
+                arguments.append((k, v))
 
     # Invoke the dynamic functionality
     return _ProcessArgumentsImpl(
-        _TypeDefinitionItemsToClickParams(
-            ResolveTypeDefinitions(
-                type_definitions,
-                force_optional=True,
-            ),
-        ),
+        click_params,
+        argument_to_result_names,
         arguments,
         ctx=ctx,
     )
@@ -438,47 +431,68 @@ def ResolveTypeDefinitions(
     *,
     force_optional: bool = False,
 ) -> dict[str, TypeDefinitionItem]:
-    # ----------------------------------------------------------------------
-    def ResolveItem(
-        item: TypeDefinitionItemType,
-    ) -> TypeDefinitionItem:
-        type_definition_item: Optional[TypeDefinitionItem] = None
+    return {
+        k: _ResolveTypeDefinitionItem(v, force_optional=force_optional)
+        for k, v in type_definitions.items()
+    }
 
-        if isinstance(item, TypeDefinitionItem):
-            type_definition_item = item
-        elif isinstance(item, tuple):
-            python_type, parameter_info = item
 
-            type_definition_item = TypeDefinitionItem(python_type, parameter_info)
-        else:
-            type_definition_item = TypeDefinitionItem.Create(
-                item,
-                is_optional=force_optional,
-            )
+# ----------------------------------------------------------------------
+# |
+# |  Private Functions
+# |
+# ----------------------------------------------------------------------
+def _CreateMultilineList(
+    values: Iterable[str],
+    indentation: int,
+    *,
+    skip_first_line: bool,
+) -> str:
+    """Creates comma-terminated lines for each value, indented in the same way as `TextwrapEx.Indent`."""
 
-        assert type_definition_item is not None
+    indentation_str = " " * indentation
 
-        if force_optional and not isinstance(
-            type_definition_item.parameter_info, typer.models.OptionInfo
-        ):
-            raise Exception("Optional types must be defined as typer.Option instances.")
+    content = f",\n{indentation_str}".join(values)
+    if not content:
+        return ""
 
-        return type_definition_item
+    if not skip_first_line:
+        content = indentation_str + content
 
-    # ----------------------------------------------------------------------
+    return content + ","
 
-    results: dict[str, TypeDefinitionItem] = {}
 
-    for k, v in type_definitions.items():
-        results[k] = ResolveItem(v)
+# ----------------------------------------------------------------------
+def _ResolveTypeDefinitionItem(
+    item: TypeDefinitionItemType,
+    *,
+    force_optional: bool,
+) -> TypeDefinitionItem:
+    type_definition_item: Optional[TypeDefinitionItem] = None
+
+    if isinstance(item, TypeDefinitionItem):
+        type_definition_item = item
+    elif isinstance(item, tuple):
+        python_type, parameter_info = item
+
+        type_definition_item = TypeDefinitionItem(python_type, parameter_info)
+    else:
+        # The item is guaranteed to be an Option when `is_optional` is set
+        return TypeDefinitionItem.Create(
+            item,
+            is_optional=force_optional,
+        )
 
-    return results
+    assert type_definition_item is not None
+
+    if force_optional and not isinstance(
+        type_definition_item.parameter_info, typer.models.OptionInfo
+    ):
+        raise Exception("Optional types must be defined as typer.Option instances.")
+
+    return type_definition_item
 
 
-# ----------------------------------------------------------------------
-# |
-# |  Private Functions
-# |
 # ----------------------------------------------------------------------
 def _TypeDefinitionItemsToClickParams(
     type_definitions: dict[str, TypeDefinitionItem],
@@ -497,19 +511,26 @@ def _TypeDefinitionItemsToClickParams(
 
 # ----------------------------------------------------------------------
 _TyperT = TypeVar("_TyperT", typer.models.ArgumentInfo, typer.models.OptionInfo)
-_TyperDictImplRegex = re.compile(
-    r"""(?#
-    Start of Line                           )^(?#
-    Key                                     )(?P<key>(?:\\[:=]|[^:=])+)(?#
-    Optional Value Begin                    )(?:(?#
-        Sep                                 )\s*[:=]\s*(?#
-        Value                               )(?P<value>.+)(?#
-    Optional Value End                      ))?(?#
-    End of Line                             )$(?#
-    )""",
-)
 
 
+# ----------------------------------------------------------------------
+@cache
+def _GetTyperDictImplRegex() -> re.Pattern[str]:
+    # Compiled on first use, as it is only needed for values that contain escapes. The pattern is
+    # used with `fullmatch`; the optional trailing newline preserves the original `$` semantics.
+    return re.compile(
+        r"""(?#
+        Key                                     )(?P<key>(?:\\[:=]|[^:=])+)(?#
+        Optional Value Begin                    )(?:(?#
+            Sep                                 )\s*[:=]\s*(?#
+            Value                               )(?P<value>.+)(?#
+        Optional Value End                      ))?(?#
+        Optional Trailing Newline               )\n?(?#
+        )""",
+    )
+
+
+# ----------------------------------------------------------------------
 def _TyperDictImpl(
     typer_type: Type[_TyperT],
     type_definitions: TypeDefinitionsType,
@@ -526,6 +547,8 @@ def _TyperDictImpl(
         ),
     )
 
+    argument_to_result_names = _CreateArgumentToResultNames(click_params)
+
     # Prepare the result
     original_callback = kwargs.pop("callback", None)
 
@@ -538,21 +561,19 @@ def _TyperDictImpl(
         arguments: list[tuple[str, Optional[str]]] = []
 
         for value in values:
-            match = _TyperDictImplRegex.match(value)
-            if not match:
+            key_and_value = _SplitDictValue(value)
+            if key_and_value is None:
                 raise typer.BadParameter(
                     "'{}' is not a valid dictionary parameters; expected '<key>:<value>' or '<key> = <value>'.".format(
                         value,
                     ),
                 )
 
-            key = match.group("key").replace("\\:", ":").replace("\\=", "=")
-            value = (match.group("value") or "").replace("\\:", ":").replace("\\=", "=")
-
-            arguments.append((key, value))
+            arguments.append(key_and_value)
 
         results = _ProcessArgumentsImpl(
             click_params,
+            argument_to_result_names,
             arguments,
             ctx=ctx,
             allow_unknown=allow_unknown,
@@ -583,24 +604,80 @@ def _TyperDictImpl(
 
 
 # ----------------------------------------------------------------------
-def _ProcessArgumentsImpl(
+def _SplitDictValue(
+    value: str,
+) -> Optional[tuple[str, str]]:
+    """Splits '<key>:<value>' or '<key> = <value>' into its parts; returns None if the value is not valid."""
+
+    if "\\" in value or "\n" in value:
+        # Escaped separators (and newlines, which the regex treats specially) are rare; let the regex
+        # handle them.
+        match = _GetTyperDictImplRegex().fullmatch(value)
+        if not match:
+            return None
+
+        return (
+            match.group("key").replace("\\:", ":").replace("\\=", "="),
+            (match.group("value") or "").replace("\\:", ":").replace("\\=", "="),
+        )
+
+    # This is equivalent to the regex: the key is everything before the first separator (including
+    # trailing whitespace) and the value is everything after it with leading whitespace removed.
+    colon_index = value.find(":")
+    equal_index = value.find("=")
+
+    if colon_index == -1:
+        sep_index = equal_index
+    elif equal_index == -1:
+        sep_index = colon_index
+    else:
+        sep_index = min(colon_index, equal_index)
+
+    if sep_index == -1:
+        return (value, "") if value else None
+
+    if sep_index == 0:
+        return None
+
+    remainder = value[sep_index + 1 :]
+    if not remainder:
+        return None
+
+    # The regex requires at least one character in the value, even if that character is whitespace
+    return value[:sep_index], remainder.lstrip() or remainder[-1]
+
+
+# ----------------------------------------------------------------------
+def _CreateArgumentToResultNames(
     click_params: dict[str, tuple[Any, Callable[..., Any]]],
-    arguments: Iterable[tuple[str, Optional[str]]],
-    *,
-    ctx: Optional[typer.Context],
-    allow_unknown: bool = False,
-) -> dict[str, Any]:
-    # Create information to map from the argument keyword to the result name
+) -> dict[str, str]:
+    """Creates information to map from the argument keyword to the result name."""
+
     argument_to_result_names: dict[str, str] = {}
 
     for result_name, (click_param, _) in click_params.items():
         for opt in click_param.opts:
-            if opt.startswith("--"):
-                opt = opt[2:]
+            opt = opt.removeprefix("--")
 
             assert opt not in argument_to_result_names, opt
             argument_to_result_names[opt] = result_name
 
+    return argument_to_result_names
+
+
+# ----------------------------------------------------------------------
+_DoesNotExist = object()
+
+
+# ----------------------------------------------------------------------
+def _ProcessArgumentsImpl(
+    click_params: dict[str, tuple[Any, Callable[..., Any]]],
+    argument_to_result_names: dict[str, str],
+    arguments: Iterable[tuple[str, Optional[str]]],
+    *,
+    ctx: Optional[typer.Context],
+    allow_unknown: bool = False,
+) -> dict[str, Any]:
     results: dict[str, Any] = {}
 
     # Group the argument values
@@ -630,28 +707,27 @@ def _ProcessArgumentsImpl(
             results[result_name] = value
 
     # Convert the values
-    does_not_exist = object()
-
-    for param_name, param_info in click_params.items():
+    for param_name, (click_param, convertor) in click_params.items():
         # For some reason, typer uses 2 different techniques to indicate that a type
         # is a list (one technique is used with Arguments, the other is used for Options).
-        is_list = param_info[0].nargs == -1 or param_info[0].multiple
+        is_list = click_param.nargs == -1 or click_param.multiple
+        default = click_param.default
 
-        param_results = results.get(param_name, does_not_exist)
-        if param_results is does_not_exist:
-            if param_info[0].required:
+        param_results = results.get(param_name, _DoesNotExist)
+        if param_results is _DoesNotExist:
+            if click_param.required:
                 param_results = None
             else:
-                if param_info[0].default is None:
+                if default is None:
                     param_results = [] if is_list else None
                 else:
-                    results[param_name] = param_info[0].default
+                    results[param_name] = default
 
                 continue
 
         if param_results is None:
-            if isinstance(param_info[0].default, bool):
-                param_results = not param_info[0].default
+            if isinstance(default, bool):
+                param_results = not default
             else:
                 raise typer.BadParameter("A value must be provided for '{}'.".format(param_name))
 
@@ -665,10 +741,10 @@ def _ProcessArgumentsImpl(
                 # Take the last value
                 param_results = param_results[-1]
 
-        param_results = param_info[0].process_value(ctx, param_results)
+        param_results = click_param.process_value(ctx, param_results)
 
-        if param_info[1] is not None:
-            param_results = param_info[1](param_results)
+        if convertor is not None:
+            param_results = convertor(param_results)
 
         results[param_name] = param_results
 
@@ -680,7 +756,8 @@ def _IsOptionalPythonType(
     python_type: Type,
 ) -> bool:
     return (
-        # The type was defined as a union and one of the union values is None
-        getattr(python_type, "__origin__", None) is Union
-        and any(value is NoneType for value in python_type.__args__)  # type: ignore
+        # The type was defined as a union (`Optional[X]`, `Union[X, None]`, or `X | None`) and one
+        # of the union values is None
+        (getattr(python_type, "__origin__", None) is Union or isinstance(python_type, UnionType))
+        and NoneType in python_type.__args__  # type: ignore
     )
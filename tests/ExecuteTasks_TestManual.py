@@ -76,16 +76,27 @@ from dbrownell_Common.Streams.DoneManager import DoneManager, Flags
 
 
 # ----------------------------------------------------------------------
-@pytest.mark.parametrize("is_interactive", [True, False])
-def test_Standard(is_interactive):
+_CpuCount = multiprocessing.cpu_count()
+
+
+# ----------------------------------------------------------------------
+@pytest.fixture(autouse=True)
+def _SeparateOutput():
+    # Start and end the output of each test on its own line when running with `--capture=no`
+    sys.stdout.write("\n")
+    yield
     sys.stdout.write("\n")
 
+
+# ----------------------------------------------------------------------
+@pytest.mark.parametrize("is_interactive", [True, False])
+def test_Standard(is_interactive):
     if is_interactive:
         stream = sys.stdout
     else:
         stream = StringIO()
 
-    num_tasks = int(multiprocessing.cpu_count() * 1.5)
+    num_tasks = int(_CpuCount * 1.5)
     num_steps = 20
 
     with DoneManager.Create(
@@ -120,16 +131,11 @@ def test_Standard(is_interactive):
             num_steps=num_steps,
         )
 
-    for index, result in enumerate(results):
-        assert result == index * 2
-
-    sys.stdout.write("\n")
+    assert results == [index * 2 for index in range(num_tasks)]
 
 
 # ----------------------------------------------------------------------
 def test_SingleThread():
-    sys.stdout.write("\n")
-
     num_tasks = 5
     num_steps = 10
 
@@ -152,17 +158,12 @@ def test_SingleThread():
             max_num_threads=1,
         )
 
-    for index, result in enumerate(results):
-        assert result == index * 2
-
-    sys.stdout.write("\n")
+    assert results == [index * 2 for index in range(num_tasks)]
 
 
 # ----------------------------------------------------------------------
 def test_YieldQueueExecutor():
-    sys.stdout.write("\n")
-
-    num_tasks = int(multiprocessing.cpu_count() * 1.5)
+    num_tasks = int(_CpuCount * 1.5)
     num_steps = 20
 
     results: list[Optional[int]] = [
@@ -193,10 +194,7 @@ def test_YieldQueueExecutor():
 
                 executor(str(index), Prepare)
 
-    for index, result in enumerate(results):
-        assert result == index * 2
-
-    sys.stdout.write("\n")
+    assert results == [index * 2 for index in range(num_tasks)]
 
 
 # ----------------------------------------------------------------------
@@ -228,6 +226,10 @@ def _ExecuteTasks(
         None,
     ] * len(task_data)
 
+    # Log files are only written when a task fails; derive a unique name for each task from a single
+    # temporary filename rather than creating a new one for every task.
+    log_filename_base = PathEx.CreateTempFileName()
+
     # ----------------------------------------------------------------------
     def Init(context: Any) -> tuple[Path, ExecuteTasksTypes.PrepareFuncType]:
         # ----------------------------------------------------------------------
@@ -250,7 +252,7 @@ def _ExecuteTasks(
 
         # ----------------------------------------------------------------------
 
-        return PathEx.CreateTempFileName(), Prepare
+        return log_filename_base.with_name(f"{log_filename_base.name}.{context}"), Prepare
 
     # ----------------------------------------------------------------------
 
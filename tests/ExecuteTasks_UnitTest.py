@@ -59,6 +59,7 @@
 # `pytest tests/dbrownell_Common/ExecuteTasks_TestManual.py -vv --capture=no --cov=dbrownell_Common.ExecuteTasks --cov-report=lcov:tests\dbrownell_Common\lcov.info`
 #
 
+import multiprocessing
 import re
 import textwrap
 
@@ -74,6 +75,10 @@ from dbrownell_Common.Streams.DoneManager import DoneManager
 from dbrownell_Common.Streams.TextWriter import TextWriter
 
 
+# ----------------------------------------------------------------------
+_NumTransformTasks = multiprocessing.cpu_count() * 3 // 2
+
+
 # ----------------------------------------------------------------------
 def test_ExecuteTasksSink():
     sink = _CreateSink()
@@ -81,8 +86,7 @@ def test_ExecuteTasksSink():
     with DoneManager.Create(sink, "Executing tasks") as dm:
         results = _ExecuteTasks(dm, lambda x: (x * 2, 0))
 
-    for index, result in enumerate(results):
-        assert result == index * 2
+    assert results == [index * 2 for index in range(5)]
 
     assert _Scrub(sink.getvalue()) == textwrap.dedent(
         """\
@@ -100,11 +104,11 @@ def test_ExecuteTasksStream():
     with DoneManager.Create(stream, "Executing tasks") as dm:
         results = _ExecuteTasks(dm, lambda x: (x * 2, 0))
 
-    for index, result in enumerate(results):
-        assert result == index * 2
+    assert results == [index * 2 for index in range(5)]
 
-    stream.content[6] = _Scrub(cast(str, stream.content[6]))
-    stream.content[-1] = _Scrub(cast(str, stream.content[-1]))
+    stream.content = [
+        _Scrub(content) if content is not None else None for content in stream.content
+    ]
 
     assert stream.content == [
         "Executing tasks...",
@@ -125,18 +129,15 @@ def test_ExecuteTasksStream():
 def test_TransformTasks(no_compress_tasks):
     sink = _CreateSink()
 
-    num_tasks = int(multiprocessing.cpu_count() * 1.5)
-
     with DoneManager.Create(sink, "Transforming tasks") as dm:
         results = _TransformTasks(
             dm,
             lambda x, _: x * 2,
-            num_tasks=num_tasks,
+            num_tasks=_NumTransformTasks,
             no_compress_tasks=no_compress_tasks,
         )
 
-    for index, result in enumerate(results):
-        assert result == index * 2
+    assert results == [index * 2 for index in range(_NumTransformTasks)]
 
     assert (
         _Scrub(sink.getvalue())
@@ -147,7 +148,7 @@ def test_TransformTasks(no_compress_tasks):
         DONE! (0, <Scrubbed Time>)
         """,
         ).format(
-            num_tasks=num_tasks,
+            num_tasks=_NumTransformTasks,
         )
     )
 
@@ -181,8 +182,7 @@ def test_YieldQueueExecutor():
 
                 executor(str(index), Prepare)
 
-    for index, result in enumerate(results):
-        assert result == index
+    assert results == list(range(10))
 
 
 # ----------------------------------------------------------------------
@@ -263,6 +263,10 @@ def _ExecuteTasks(
         None,
     ] * len(task_data)
 
+    # Log files are only written when a task fails; derive a unique name for each task from a single
+    # temporary filename rather than creating a new one for every task.
+    log_filename_base = PathEx.CreateTempFileName()
+
     # ----------------------------------------------------------------------
     def Init(context: Any) -> tuple[Path, ExecuteTasksTypes.PrepareFuncType]:
         # ----------------------------------------------------------------------
@@ -282,7 +286,7 @@ def _ExecuteTasks(
 
         # ----------------------------------------------------------------------
 
-        return PathEx.CreateTempFileName(), Prepare
+        return log_filename_base.with_name(f"{log_filename_base.name}.{context}"), Prepare
 
     # ----------------------------------------------------------------------
 
@@ -330,8 +334,8 @@ def _CreateSink(
 def _Scrub(
     content: str,
 ) -> str:
-    return re.sub(
-        r"\d+:\d{2}:\d{2}(?:\.\d+)?",
-        "<Scrubbed Time>",
-        content,
-    )
+    return _ScrubRegex.sub("<Scrubbed Time>", content)
+
+
+# ----------------------------------------------------------------------
+_ScrubRegex = re.compile(r"\d+:\d{2}:\d{2}(?:\.\d+)?")
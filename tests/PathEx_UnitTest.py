@@ -22,6 +22,11 @@ import pytest
 from dbrownell_Common.PathEx import *
 
 
+# ----------------------------------------------------------------------
+_ThisFile = Path(__file__)
+_ThisDir = _ThisFile.parent
+
+
 # ----------------------------------------------------------------------
 def test_CreateTempFilename():
     temp_filename = CreateTempFileName()
@@ -44,10 +49,8 @@ def test_CreateTempDirectory():
 
 # ----------------------------------------------------------------------
 def test_EnsureExists():
-    this_file = Path(__file__)
-
     # Exists
-    assert EnsureExists(this_file) == this_file
+    assert EnsureExists(_ThisFile) == _ThisFile
 
     # None
     with pytest.raises(
@@ -57,7 +60,7 @@ def test_EnsureExists():
         EnsureExists(None)
 
     # Does not exist
-    filename = this_file.parent / "Does Not Exist.txt"
+    filename = _ThisDir / "Does Not Exist.txt"
 
     with pytest.raises(
         ValueError,
@@ -68,10 +71,8 @@ def test_EnsureExists():
 
 # ----------------------------------------------------------------------
 def test_EnsureFile():
-    this_file = Path(__file__)
-
     # Exists
-    assert EnsureFile(this_file) == this_file
+    assert EnsureFile(_ThisFile) == _ThisFile
 
     # None
     with pytest.raises(
@@ -81,7 +82,7 @@ def test_EnsureFile():
         EnsureFile(None)
 
     # Does not exist
-    filename = this_file.parent / "Does Not Exist.txt"
+    filename = _ThisDir / "Does Not Exist.txt"
 
     with pytest.raises(
         ValueError,
@@ -92,17 +93,15 @@ def test_EnsureFile():
     # Not a file
     with pytest.raises(
         ValueError,
-        match=re.escape("'{}' is not a file.".format(this_file.parent)),
+        match=re.escape("'{}' is not a file.".format(_ThisDir)),
     ):
-        EnsureFile(this_file.parent)
+        EnsureFile(_ThisDir)
 
 
 # ----------------------------------------------------------------------
 def test_EnsureDir():
-    this_file = Path(__file__)
-
     # Exists
-    assert EnsureDir(this_file.parent) == this_file.parent
+    assert EnsureDir(_ThisDir) == _ThisDir
 
     # None
     with pytest.raises(
@@ -112,7 +111,7 @@ def test_EnsureDir():
         EnsureDir(None)
 
     # Does not exist
-    filename = this_file.parent / "Does Not Exist"
+    filename = _ThisDir / "Does Not Exist"
 
     with pytest.raises(
         ValueError,
@@ -123,9 +122,9 @@ def test_EnsureDir():
     # Not a directory
     with pytest.raises(
         ValueError,
-        match=re.escape("'{}' is not a directory.".format(this_file)),
+        match=re.escape("'{}' is not a directory.".format(_ThisFile)),
     ):
-        EnsureDir(this_file)
+        EnsureDir(_ThisFile)
 
 
 # ----------------------------------------------------------------------
@@ -145,10 +144,8 @@ def test_CreateRelativePath():
 
 # ----------------------------------------------------------------------
 def test_GetCommonPath():
-    parent_dir = Path(__file__).parent
-
-    assert GetCommonPath(parent_dir) == parent_dir
-    assert GetCommonPath(Path(__file__)) == parent_dir
+    assert GetCommonPath(_ThisDir) == _ThisDir
+    assert GetCommonPath(_ThisFile) == _ThisDir
     assert GetCommonPath(Path("a/b/c"), Path("a/b/d")) == Path("a/b").resolve()
     assert GetCommonPath(Path("a/b/c"), Path("a/b")) == Path("a/b").resolve()
     assert (
@@ -163,20 +160,30 @@ def test_GetCommonPath():
 
 
 # ----------------------------------------------------------------------
-def test_GetSizeDisplay():
-    assert GetSizeDisplay(1000) == "1000 B"
-    assert GetSizeDisplay(10000) == "9.8 KB"
-    assert GetSizeDisplay(100000) == "97.7 KB"
-    assert GetSizeDisplay(1000000) == "976.6 KB"
-    assert GetSizeDisplay(10000000) == "9.5 MB"
-    assert GetSizeDisplay(100000000) == "95.4 MB"
-    assert GetSizeDisplay(1000000000) == "953.7 MB"
-    assert GetSizeDisplay(10000000000) == "9.3 GB"
-    assert GetSizeDisplay(100000000000000000) == "88.8 PB"
-    assert GetSizeDisplay(1000000000000000000000) == "867.4 EB"
-    assert GetSizeDisplay(10000000000000000000000000) == "8.3 YiB"
-    assert GetSizeDisplay(1000000000000000000000000000000) == "827180.6 YiB"
-    assert GetSizeDisplay(Path(__file__)) != ""
+@pytest.mark.parametrize(
+    "size, expected",
+    [
+        (1000, "1000 B"),
+        (10000, "9.8 KB"),
+        (100000, "97.7 KB"),
+        (1000000, "976.6 KB"),
+        (10000000, "9.5 MB"),
+        (100000000, "95.4 MB"),
+        (1000000000, "953.7 MB"),
+        (10000000000, "9.3 GB"),
+        (100000000000000000, "88.8 PB"),
+        (1000000000000000000000, "867.4 EB"),
+        (10000000000000000000000000, "8.3 YiB"),
+        (1000000000000000000000000000000, "827180.6 YiB"),
+    ],
+)
+def test_GetSizeDisplay(size, expected):
+    assert GetSizeDisplay(size) == expected
+
+
+# ----------------------------------------------------------------------
+def test_GetSizeDisplayPath():
+    assert GetSizeDisplay(_ThisFile) != ""
 
 
 # ----------------------------------------------------------------------
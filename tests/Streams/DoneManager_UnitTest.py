@@ -314,18 +314,7 @@ def test_DisplayExceptionDetails():
 
     content = _Scrub(sink.getvalue())
 
-    assert re.match(
-        r"""(?#
-        Header                  )Testing\.\.\.\n(?#
-        Error                   )  ERROR: Traceback \(most recent call last\):\n(?#
-        Traceback lines begin   )(?:(?#
-          Traceback line        )         .+\n(?#
-        Traceback lines end     ))+?(?#
-        Last Traceback line     )         Exception: The exception\n+(?#
-        Done                    )DONE! \(-1, <Scrubbed Time>\)\n(?#
-        )""",
-        content,
-    ), content
+    assert _DisplayExceptionDetailsRegex.match(content), content
 
 
 # ----------------------------------------------------------------------
@@ -423,7 +412,7 @@ def test_SuppressExceptionsNoDisplayExceptions():
 # ----------------------------------------------------------------------
 def test_StandardFlags():
     with DoneManager.Create(
-        _CreateSink(), "Testing", flags=Flags.Create(verbose=False, debug=False)
+        StringIO(), "Testing", flags=Flags.Create(verbose=False, debug=False)
     ) as dm:
         assert dm.is_verbose is False
         assert dm.is_debug is False
@@ -432,7 +421,7 @@ def test_StandardFlags():
 # ----------------------------------------------------------------------
 def test_VerboseFlags():
     with DoneManager.Create(
-        _CreateSink(), "Testing", flags=Flags.Create(verbose=True, debug=False)
+        StringIO(), "Testing", flags=Flags.Create(verbose=True, debug=False)
     ) as dm:
         assert dm.is_verbose is True
         assert dm.is_debug is False
@@ -441,7 +430,7 @@ def test_VerboseFlags():
 # ----------------------------------------------------------------------
 def test_DebugFlags():
     with DoneManager.Create(
-        _CreateSink(), "Testing", flags=Flags.Create(verbose=False, debug=True)
+        StringIO(), "Testing", flags=Flags.Create(verbose=False, debug=True)
     ) as dm:
         assert dm.is_verbose is True
         assert dm.is_debug is True
@@ -805,6 +794,11 @@ def test_WarningPrecedence():
     )
 
 
+# ----------------------------------------------------------------------
+_StatusWidth = Capabilities.DEFAULT_COLUMNS - len("  ") + 1
+_NestedStatusWidth = Capabilities.DEFAULT_COLUMNS - len("    ") + 1
+
+
 # ----------------------------------------------------------------------
 class TestWriteStatus:
     # ----------------------------------------------------------------------
@@ -823,7 +817,7 @@ class TestWriteStatus:
             None,
             "\n",
             "  ",
-            "\r  Line 1".ljust(Capabilities.DEFAULT_COLUMNS - len("  ") + 1),
+            "\r  Line 1".ljust(_StatusWidth),
             "\n",
             "  ",
             "\x1b[1A\r",
@@ -849,12 +843,12 @@ class TestWriteStatus:
             None,
             "\n",  # 0 - 2
             "  ",
-            "\r  Line 1".ljust(Capabilities.DEFAULT_COLUMNS - len("  ") + 1),
+            "\r  Line 1".ljust(_StatusWidth),
             "\n",  # 3 - 5
             "  ",
             "\x1b[1A\r",
             "  ",
-            "\r".ljust(Capabilities.DEFAULT_COLUMNS - len("  ") + 1),
+            "\r".ljust(_StatusWidth),
             "\n",  # 7 - 9
             "  ",
             "\x1b[1A\r",
@@ -931,7 +925,7 @@ class TestWriteStatus:
             None,
             "\n",  # 0 - 2
             "  ",
-            "\r  Line 1".ljust(Capabilities.DEFAULT_COLUMNS - len("  ") + 1),
+            "\r  Line 1".ljust(_StatusWidth),
             "\n",  # 3 - 5
             "  ",
             "\x1b[1A\r",
@@ -944,29 +938,29 @@ class TestWriteStatus:
             "\n",  # 6 - 14
             "  ",
             "  ",
-            "\r    Line 2".ljust(Capabilities.DEFAULT_COLUMNS - len("    ") + 1),
+            "\r    Line 2".ljust(_NestedStatusWidth),
             "\n",  # 15 - 18
             "  ",
             "  ",
-            "\r    Line 3".ljust(Capabilities.DEFAULT_COLUMNS - len("    ") + 1),
+            "\r    Line 3".ljust(_NestedStatusWidth),
             "\n",  # 19 - 22
             "  ",
             "  ",
             "\x1b[2A\r",
             "  ",
             "  ",
-            "\r    Line 4".ljust(Capabilities.DEFAULT_COLUMNS - len("    ") + 1),
+            "\r    Line 4".ljust(_NestedStatusWidth),
             "\n",  # 23 - 29
             "  ",
             "  ",
-            "\r".ljust(Capabilities.DEFAULT_COLUMNS - len("    ") + 1),
+            "\r".ljust(_NestedStatusWidth),
             "\n",  # 30 - 33
             "  ",
             "  ",
             "\x1b[2A\r",
             "  ",
             "  ",
-            "\r".ljust(Capabilities.DEFAULT_COLUMNS - len("    ") + 1),
+            "\r".ljust(_NestedStatusWidth),
             "\n",  # 34 - 40
             "  ",
             "  ",
@@ -979,7 +973,7 @@ class TestWriteStatus:
             "\n",  # 41 - 49
             None,
             "  ",
-            "\r  Line 5".ljust(Capabilities.DEFAULT_COLUMNS - len("  ") + 1),
+            "\r  Line 5".ljust(_StatusWidth),
             "\n",  # 50 - 53
             "  ",
             "\x1b[1A\r",
@@ -1007,18 +1001,18 @@ class TestWriteStatus:
             None,
             "\n",  # 0 - 2
             "  ",
-            "\r  Line 1".ljust(Capabilities.DEFAULT_COLUMNS - len("  ") + 1),
+            "\r  Line 1".ljust(_StatusWidth),
             "\n",  # 3 - 5
             "  ",
-            "\r  Line 2".ljust(Capabilities.DEFAULT_COLUMNS - len("  ") + 1),
+            "\r  Line 2".ljust(_StatusWidth),
             "\n",  # 6 - 8
             "  ",
             "\x1b[2A\r",
             "  ",
-            "\r".ljust(Capabilities.DEFAULT_COLUMNS - len("  ") + 1),
+            "\r".ljust(_StatusWidth),
             "\n",  # 9 - 13
             "  ",
-            "\r".ljust(Capabilities.DEFAULT_COLUMNS - len("  ") + 1),
+            "\r".ljust(_StatusWidth),
             "\n",  # 14 - 16
             "  ",
             "\x1b[2A\r",
@@ -1041,18 +1035,18 @@ class TestWriteStatus:
             None,
             "\n",
             "  ",
-            "\r  Line 1".ljust(Capabilities.DEFAULT_COLUMNS - len("  ") + 1),
+            "\r  Line 1".ljust(_StatusWidth),
             "\n",
             "  ",
-            "\r  Line 2".ljust(Capabilities.DEFAULT_COLUMNS - len("  ") + 1),
+            "\r  Line 2".ljust(_StatusWidth),
             "\n",
             "  ",
             "\x1b[2A\r",
             "  ",
-            "\r".ljust(Capabilities.DEFAULT_COLUMNS - len("  ") + 1),
+            "\r".ljust(_StatusWidth),
             "\n",
             "  ",
-            "\r".ljust(Capabilities.DEFAULT_COLUMNS - len("  ") + 1),
+            "\r".ljust(_StatusWidth),
             "\n",
             "  ",
             "\x1b[2A\r",
@@ -1080,10 +1074,10 @@ class TestWriteStatus:
             None,
             "\n",
             "  ",
-            "\r  Line 1".ljust(Capabilities.DEFAULT_COLUMNS - len("  ") + 1),
+            "\r  Line 1".ljust(_StatusWidth),
             "\n",
             "  ",
-            "\r  Line 2".ljust(Capabilities.DEFAULT_COLUMNS - len("  ") + 1),
+            "\r  Line 2".ljust(_StatusWidth),
             "\n",
             "  ",
             "\x1b[2A\r",
@@ -1109,10 +1103,10 @@ class TestWriteStatus:
             None,
             "\n",
             "  ",
-            "\r  Line 1".ljust(Capabilities.DEFAULT_COLUMNS - len("  ") + 1),
+            "\r  Line 1".ljust(_StatusWidth),
             "\n",
             "  ",
-            "\r  Line 2".ljust(Capabilities.DEFAULT_COLUMNS - len("  ") + 1),
+            "\r  Line 2".ljust(_StatusWidth),
             "\n",
             "  ",
             "\x1b[2A\r",
@@ -1145,32 +1139,32 @@ class TestWriteStatus:
             None,
             "\n",
             "  ",
-            "\r  Short 1".ljust(Capabilities.DEFAULT_COLUMNS - len("  ") + 1),
+            "\r  Short 1".ljust(_StatusWidth),
             "\n",
             "  ",
-            "\r  Short 2".ljust(Capabilities.DEFAULT_COLUMNS - len("  ") + 1),
+            "\r  Short 2".ljust(_StatusWidth),
             "\n",
             "  ",
             "\x1b[2A\r",
             "  ",
-            "\r  This is longer status 1".ljust(Capabilities.DEFAULT_COLUMNS - len("  ") + 1),
+            "\r  This is longer status 1".ljust(_StatusWidth),
             "\n",
             "  ",
-            "\r  This is longer status 2".ljust(Capabilities.DEFAULT_COLUMNS - len("  ") + 1),
+            "\r  This is longer status 2".ljust(_StatusWidth),
             "\n",
             "  ",
-            "\r  This is longer status 3".ljust(Capabilities.DEFAULT_COLUMNS - len("  ") + 1),
+            "\r  This is longer status 3".ljust(_StatusWidth),
             "\n",
             "  ",
             "\x1b[3A\r",
             "  ",
-            "\r  Again 1".ljust(Capabilities.DEFAULT_COLUMNS - len("  ") + 1),
+            "\r  Again 1".ljust(_StatusWidth),
             "\n",
             "  ",
-            "\r".ljust(Capabilities.DEFAULT_COLUMNS - len("  ") + 1),
+            "\r".ljust(_StatusWidth),
             "\n",
             "  ",
-            "\r".ljust(Capabilities.DEFAULT_COLUMNS - len("  ") + 1),
+            "\r".ljust(_StatusWidth),
             "\n",
             "  ",
             "\x1b[3A\r",
@@ -1205,18 +1199,18 @@ class TestWriteStatus:
             "One",
             "\n",
             "  ",
-            "\r  Status 1".ljust(Capabilities.DEFAULT_COLUMNS - len("  ") + 1),
+            "\r  Status 1".ljust(_StatusWidth),
             "\n",
             "  ",
-            "\r  Status 2".ljust(Capabilities.DEFAULT_COLUMNS - len("  ") + 1),
+            "\r  Status 2".ljust(_StatusWidth),
             "\n",
             "  ",
             "\x1b[2A\r",
             "  ",
-            "\r".ljust(Capabilities.DEFAULT_COLUMNS - len("  ") + 1),
+            "\r".ljust(_StatusWidth),
             "\n",
             "  ",
-            "\r".ljust(Capabilities.DEFAULT_COLUMNS - len("  ") + 1),
+            "\r".ljust(_StatusWidth),
             "\n",
             "  ",
             "\x1b[2A\r",
@@ -1224,26 +1218,26 @@ class TestWriteStatus:
             "Two",
             "\n",
             "  ",
-            "\r  Status 1".ljust(Capabilities.DEFAULT_COLUMNS - len("  ") + 1),
+            "\r  Status 1".ljust(_StatusWidth),
             "\n",
             "  ",
-            "\r  Status 2".ljust(Capabilities.DEFAULT_COLUMNS - len("  ") + 1),
+            "\r  Status 2".ljust(_StatusWidth),
             "\n",
             "  ",
             "\x1b[2A\r",
             "  ",
-            "\r  Status 3".ljust(Capabilities.DEFAULT_COLUMNS - len("  ") + 1),
+            "\r  Status 3".ljust(_StatusWidth),
             "\n",
             "  ",
-            "\r  Status 4".ljust(Capabilities.DEFAULT_COLUMNS - len("  ") + 1),
+            "\r  Status 4".ljust(_StatusWidth),
             "\n",
             "  ",
             "\x1b[2A\r",
             "  ",
-            "\r".ljust(Capabilities.DEFAULT_COLUMNS - len("  ") + 1),
+            "\r".ljust(_StatusWidth),
             "\n",
             "  ",
-            "\r".ljust(Capabilities.DEFAULT_COLUMNS - len("  ") + 1),
+            "\r".ljust(_StatusWidth),
             "\n",
             "  ",
             "\x1b[2A\r",
@@ -1608,8 +1602,22 @@ def _CreateSink(
 def _Scrub(
     content: str,
 ) -> str:
-    return re.sub(
-        r"\d+:\d{2}:\d{2}(?:\.\d+)?",
-        "<Scrubbed Time>",
-        content,
-    )
+    return _ScrubRegex.sub("<Scrubbed Time>", content)
+
+
+# ----------------------------------------------------------------------
+_ScrubRegex = re.compile(r"\d+:\d{2}:\d{2}(?:\.\d+)?")
+
+
+# ----------------------------------------------------------------------
+_DisplayExceptionDetailsRegex = re.compile(
+    r"""(?#
+    Header                  )Testing\.\.\.\n(?#
+    Error                   )  ERROR: Traceback \(most recent call last\):\n(?#
+    Traceback lines begin   )(?:(?#
+      Traceback line        )         .+\n(?#
+    Traceback lines end     ))+?(?#
+    Last Traceback line     )         Exception: The exception\n+(?#
+    Done                    )DONE! \(-1, <Scrubbed Time>\)\n(?#
+    )""",
+)
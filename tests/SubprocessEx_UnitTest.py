@@ -13,6 +13,7 @@
 # ----------------------------------------------------------------------
 """Unit tests for SubprocessEx.py."""
 
+import asyncio
 import re
 import textwrap
 
@@ -20,6 +21,7 @@ import pytest
 from unittest.mock import MagicMock as Mock
 
 from dbrownell_Common.SubprocessEx import *
+from dbrownell_Common.SubprocessEx import _ReadStateMachine
 from dbrownell_Common.Streams.Capabilities import Capabilities
 
 
@@ -124,7 +126,7 @@ class TestStream:
         result = Stream("echo Hello World", mock)
 
         assert result == 0
-        assert mock.write.call_count == len("Hello World\n")
+        assert _GetContent(mock) == "Hello World\n"
 
     # ----------------------------------------------------------------------
     def test_LineDelimited(self):
@@ -176,6 +178,18 @@ class TestStream:
 
         assert mock.flush.call_count == 1
 
+    # ----------------------------------------------------------------------
+    def test_NoStdin(self):
+        mock = Mock()
+
+        result = Stream(
+            '''python -c "import sys; sys.stdout.write(repr(sys.stdin.read()))"''',
+            mock,
+        )
+
+        assert result == 0
+        assert _GetContent(mock) == "''"
+
     # ----------------------------------------------------------------------
     def test_AsciiEscape(self):
         mock = Mock()
@@ -183,11 +197,7 @@ class TestStream:
         result = Stream('''python -c "print('\x1b[31;1mERROR:\x1b[0m Hello!')"''', mock)
 
         assert result == 0
-
-        assert mock.write.call_count == 16
-        assert mock.write.call_args_list[0].args[0] == "\x1b[31;1m"
-        assert mock.write.call_args_list[1 + len("ERROR:")].args[0] == "\x1b[0m"
-        assert mock.write.call_args_list[15].args[0] == "\n"
+        assert _GetContent(mock) == "\x1b[31;1mERROR:\x1b[0m Hello!\n"
 
         assert mock.flush.call_count == 1
 
@@ -198,9 +208,7 @@ class TestStream:
         result = Stream('''python -c "import sys; sys.stdout.write('🔥')"''', mock)
 
         assert result == 0
-
-        assert mock.write.call_count == 1
-        assert mock.write.call_args_list[0].args[0] == "🔥"
+        assert _GetContent(mock) == "🔥"
 
         assert mock.flush.call_count == 1
 
@@ -211,9 +219,198 @@ class TestStream:
         result = Stream('''python -c "print('\u2082')"''', mock)
 
         assert result == 0
+        assert _GetContent(mock) == "₂\n"
 
-        assert mock.write.call_count == 2
-        assert mock.write.call_args_list[0].args[0] == "₂"
-        assert mock.write.call_args_list[1].args[0] == "\n"
+        assert mock.flush.call_count == 1
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.parametrize("line_delimited_output", [False, True])
+    @pytest.mark.parametrize(
+        "content,expected",
+        [
+            ("caf\\xe9 x\\n", "caf\ufffd x\n"),  # Invalid byte
+            ("\\xf0\\x9f x\\n", "\ufffd x\n"),  # Truncated multi-byte sequence
+        ],
+    )
+    def test_InvalidUtf8(self, content, expected, line_delimited_output):
+        mock = Mock()
+
+        result = Stream(
+            f'''python -c "import sys; sys.stdout.buffer.write(b'{content}')"''',
+            mock,
+            line_delimited_output=line_delimited_output,
+        )
+
+        if line_delimited_output:
+            # The line-delimited flush always writes a trailing newline (see test_LineDelimited)
+            expected += "\n"
+
+        assert result == 0
+        assert _GetContent(mock) == expected
+
+        assert mock.flush.call_count == 1
+
+
+# ----------------------------------------------------------------------
+class TestRunAsync:
+    # ----------------------------------------------------------------------
+    def test_Standard(self):
+        result = asyncio.run(RunAsync("echo Hello World!"))
+
+        assert result.returncode == 0
+        assert result.output == "Hello World!\n"
+        assert result.error_command_line is None
+
+    # ----------------------------------------------------------------------
+    def test_Error(self):
+        result = asyncio.run(RunAsync("this_command_does_not_exist"))
+
+        assert result.returncode != 0
+        assert result.output != ""
+        assert result.error_command_line == "this_command_does_not_exist"
+
+    # ----------------------------------------------------------------------
+    def test_Multiple(self):
+        # ----------------------------------------------------------------------
+        async def Execute() -> list[RunResult]:
+            return await asyncio.gather(*(RunAsync(f"echo {index}") for index in range(5)))
+
+        # ----------------------------------------------------------------------
+
+        results = asyncio.run(Execute())
+
+        assert [result.returncode for result in results] == [0] * 5
+        assert [result.output for result in results] == [f"{index}\n" for index in range(5)]
+
+
+# ----------------------------------------------------------------------
+class TestStreamAsync:
+    # ----------------------------------------------------------------------
+    def test_Standard(self):
+        mock = Mock()
+
+        result = asyncio.run(StreamAsync("echo Hello World", mock))
+
+        assert result == 0
+        assert _GetContent(mock) == "Hello World\n"
+
+        assert mock.flush.call_count == 1
+
+    # ----------------------------------------------------------------------
+    def test_Stdin(self):
+        mock = Mock()
+
+        result = asyncio.run(
+            StreamAsync(
+                '''python -c "import sys; sys.stdout.write(sys.stdin.read())"''',
+                mock,
+                stdin="Hello!",
+                line_delimited_output=True,
+            ),
+        )
+
+        assert result == 0
+
+        assert mock.write.call_count == 1
+        assert mock.write.call_args_list[0].args[0] == "Hello!\n"
 
         assert mock.flush.call_count == 1
+
+    # ----------------------------------------------------------------------
+    def test_BrokenStdin(self):
+        mock = Mock()
+
+        # The process exits without reading stdin, so writing more than the pipe can buffer fails
+        result = asyncio.run(
+            StreamAsync(
+                '''python -c "pass"''',
+                mock,
+                stdin="x" * (4 * 1024 * 1024),
+            ),
+        )
+
+        assert result == -1
+
+        assert mock.flush.call_count == 1
+
+    # ----------------------------------------------------------------------
+    def test_Multiple(self):
+        mocks = [Mock() for _ in range(5)]
+
+        # ----------------------------------------------------------------------
+        async def Execute() -> list[int]:
+            return await asyncio.gather(
+                *(StreamAsync(f"echo {index}", mock) for index, mock in enumerate(mocks))
+            )
+
+        # ----------------------------------------------------------------------
+
+        results = asyncio.run(Execute())
+
+        assert results == [0] * 5
+        assert [_GetContent(mock) for mock in mocks] == [f"{index}\n" for index in range(5)]
+
+
+# ----------------------------------------------------------------------
+class TestReadStateMachine:
+    # ----------------------------------------------------------------------
+    def test_AsciiEscape(self):
+        mock = Mock()
+
+        machine = _ReadStateMachine(mock, convert_newlines=False)
+
+        machine.Process("\x1b[31;1mERROR:\x1b[0m Hello!\n".encode("utf-8"))
+        machine.Flush()
+
+        assert [call.args[0] for call in mock.call_args_list] == [
+            "\x1b[31;1m",
+            "ERROR:",
+            "\x1b[0m",
+            " Hello!\n",
+        ]
+
+    # ----------------------------------------------------------------------
+    def test_MultiByte(self):
+        mock = Mock()
+
+        machine = _ReadStateMachine(mock, convert_newlines=False)
+
+        machine.Process("\u2082\n".encode("utf-8"))
+        machine.Flush()
+
+        assert [call.args[0] for call in mock.call_args_list] == ["₂", "\n"]
+
+    # ----------------------------------------------------------------------
+    def test_PlainContentAcrossChunks(self):
+        mock = Mock()
+
+        machine = _ReadStateMachine(mock, convert_newlines=False)
+
+        machine.Process(b"Hello ")
+        machine.Process(b"\x1b[0")
+        machine.Process(b"mWorld")
+        machine.Flush()
+
+        assert [call.args[0] for call in mock.call_args_list] == ["Hello ", "\x1b[0m", "World"]
+
+    # ----------------------------------------------------------------------
+    def test_ConvertNewlines(self):
+        mock = Mock()
+
+        machine = _ReadStateMachine(mock, convert_newlines=True)
+
+        machine.Process(b"one\r\ntwo")
+        machine.Flush()
+
+        assert [call.args[0] for call in mock.call_args_list] == ["one", "\r\n", "two"]
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Private Functions
+# |
+# ----------------------------------------------------------------------
+def _GetContent(
+    mock: Mock,
+) -> str:
+    return "".join(call.args[0] for call in mock.write.call_args_list)
@@ -13,6 +13,8 @@
 # ----------------------------------------------------------------------
 """Unit tests for TextwrapEx.py."""
 
+import textwrap
+
 import pytest
 
 from dbrownell_Common.TextwrapEx import *
@@ -185,6 +187,10 @@ class TestCreateStatusText:
             == "\x1b[32;1m1\x1b[0m succeeded, \x1b[31;1m2\x1b[0m failed"
         )
 
+    # ----------------------------------------------------------------------
+    def test_NoValues(self):
+        assert CreateStatusText(None, None, None) == ""
+
 
 # ----------------------------------------------------------------------
 class TestIndent:
@@ -237,11 +243,21 @@ class TestIndent:
             == "Line1\n\n***Line3\n"
         )
 
+    # ----------------------------------------------------------------------
+    def test_SkipFirstLineLeadingWhitespace(self):
+        assert Indent("\n  \nLine3\nLine4", "***", skip_first_line=True) == "\n  \nLine3\n***Line4"
+
+    # ----------------------------------------------------------------------
+    def test_LargeAndNegativeWhitespacePrefix(self):
+        assert Indent("Line1\n", 40) == " " * 40 + "Line1\n"
+        assert Indent("Line1\n", -1) == "Line1\n"
+
 
 # ----------------------------------------------------------------------
 def test_BoundedLJust():
     assert [
         BoundedLJust("test", 10),
+        BoundedLJust("0123456789", 10),
         BoundedLJust("0123456789A", 10),
         BoundedLJust("0123456789AB", 10),
         BoundedLJust("0123456789A", 9),
@@ -250,6 +266,7 @@ def test_BoundedLJust():
         BoundedLJust("0123456789ABCDEFGHIJKL", 13),
     ] == [
         "test      ",
+        "0123456789",
         "012...789A",
         "012...89AB",
         "012...89A",
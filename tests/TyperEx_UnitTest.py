@@ -22,6 +22,22 @@ import pytest
 from typer.testing import CliRunner
 
 from dbrownell_Common.TyperEx import *
+from dbrownell_Common.TyperEx import _SplitDictValue
+
+
+# ----------------------------------------------------------------------
+class TestTypeDefinitionItem:
+    # ----------------------------------------------------------------------
+    def test_Required(self):
+        assert isinstance(TypeDefinitionItem.Create(int).parameter_info, typer.models.ArgumentInfo)
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.parametrize("python_type", [Optional[int], Union[int, None], int | None])
+    def test_Optional(self, python_type):
+        assert isinstance(
+            TypeDefinitionItem.Create(python_type).parameter_info,
+            typer.models.OptionInfo,
+        )
 
 
 # ----------------------------------------------------------------------
@@ -294,6 +310,26 @@ class TestProcessDynamicArgs:
             """,
         )
 
+    # ----------------------------------------------------------------------
+    def test_DefaultMap(self, _app):
+        result = CliRunner().invoke(
+            _app,
+            ["10"],
+            default_map={
+                "arg2": True,
+                "extra-args2": "abc",
+            },
+        )
+
+        assert result.exit_code == 0
+        assert result.stdout == textwrap.dedent(
+            """\
+            10
+            True
+            {'extra_args2': 'abc'}
+            """,
+        )
+
     # ----------------------------------------------------------------------
     def test_TwoArgs(self, _app):
         result = CliRunner().invoke(_app, ["10", "--arg2"])
@@ -393,3 +429,27 @@ class TestProcessDynamicArgs:
         # ----------------------------------------------------------------------
 
         return app
+
+
+# ----------------------------------------------------------------------
+class TestSplitDictValue:
+    # ----------------------------------------------------------------------
+    @pytest.mark.parametrize(
+        "value, expected",
+        [
+            ("one:1", ("one", "1")),
+            ("one = 1", ("one ", "1")),
+            ("one=a:b", ("one", "a:b")),
+            ("one", ("one", "")),
+            ("one: ", ("one", " ")),
+            ("one\\:two:3", ("one:two", "3")),
+            ("one\\=two = a\\=b", ("one=two ", "a=b")),
+        ],
+    )
+    def test_Valid(self, value, expected):
+        assert _SplitDictValue(value) == expected
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.parametrize("value", ["", ":1", "=1", "one:"])
+    def test_Invalid(self, value):
+        assert _SplitDictValue(value) is None